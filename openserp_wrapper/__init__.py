@@ -6,8 +6,9 @@ Author: OpenSerp Wrapper Team
 License: MIT
 """
 
+import importlib
+
 from .client import OpenSerpClient
-from .async_client import AsyncOpenSerpClient
 from .cache import Cache, InMemoryCache, RedisCache
 from .rate_limiter import RateLimiter
 from .exceptions import (
@@ -16,8 +17,15 @@ from .exceptions import (
     OpenSerpTimeoutError,
     OpenSerpAPIError,
     OpenSerpValidationError,
+    OpenSerpRateLimitError,
 )
 
+# The async client is imported on first attribute access (PEP 562) so that
+# ``import openserp_wrapper`` does not pull in aiohttp
+_LAZY_ATTRS = {
+    "AsyncOpenSerpClient": ".async_client",
+}
+
 __version__ = "1.0.0"
 __author__ = "OpenSerp Wrapper Team"
 __license__ = "MIT"
@@ -34,4 +42,18 @@ __all__ = [
     "OpenSerpTimeoutError",
     "OpenSerpAPIError",
     "OpenSerpValidationError",
+    "OpenSerpRateLimitError",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
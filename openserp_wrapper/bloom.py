@@ -0,0 +1,58 @@
+"""
+Bloom filter used to skip cache lookups for keys that were never stored
+"""
+
+import hashlib
+import math
+import threading
+
+
+class BloomFilter:
+    """Probabilistic set membership over string keys
+
+    A negative answer is always correct; a positive answer is wrong with
+    probability close to ``error_rate`` while fewer than ``capacity`` keys
+    have been added.
+
+    Args:
+        capacity: Expected number of distinct keys (default: 10000)
+        error_rate: Target false positive probability (default: 0.01)
+    """
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 0.01):
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _indexes(self, key: str):
+        """Yield bit positions for key using double hashing"""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        """Add key to the filter"""
+        with self._lock:
+            for index in self._indexes(key):
+                self._bits[index >> 3] |= 1 << (index & 7)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(
+            bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(key)
+        )
+
+    def clear(self) -> None:
+        """Remove all keys from the filter"""
+        with self._lock:
+            self._bits = bytearray(len(self._bits))
@@ -0,0 +1,109 @@
+"""
+Cache backends for OpenSerp wrapper
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+from .exceptions import OpenSerpCacheError
+
+
+class Cache(ABC):
+    """Abstract cache interface used by the clients"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store value under key, expiring after ttl seconds if given"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached values"""
+
+
+class InMemoryCache(Cache):
+    """Thread-safe in-process cache with per-entry expiry
+
+    Args:
+        max_size: Maximum number of entries kept (default: 1000)
+    """
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            with self._lock:
+                self._data.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.max_size:
+                # Evict the oldest insertion
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (value, expires_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCache(Cache):
+    """Redis-backed cache for sharing results between processes
+
+    Args:
+        host: Redis host (default: localhost)
+        port: Redis port (default: 6379)
+        db: Redis database number (default: 0)
+        prefix: Key prefix used to namespace entries (default: 'openserp:')
+        **kwargs: Extra arguments passed to ``redis.Redis``
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        prefix: str = "openserp:",
+        **kwargs,
+    ):
+        # Imported here so that redis is only required when this backend is used
+        import redis
+
+        self.prefix = prefix
+        self._redis = redis.Redis(host=host, port=port, db=db, **kwargs)
+        self._errors = (redis.RedisError,)
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            return self._redis.get(self.prefix + key)
+        except self._errors as e:
+            raise OpenSerpCacheError(f"Cache get failed: {str(e)}") from e
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        try:
+            self._redis.set(self.prefix + key, value, ex=ttl or None)
+        except self._errors as e:
+            raise OpenSerpCacheError(f"Cache set failed: {str(e)}") from e
+
+    def clear(self) -> None:
+        try:
+            keys = list(self._redis.scan_iter(match=self.prefix + "*"))
+            if keys:
+                self._redis.delete(*keys)
+        except self._errors as e:
+            raise OpenSerpCacheError(f"Cache clear failed: {str(e)}") from e
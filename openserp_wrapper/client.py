@@ -2,14 +2,19 @@
 Synchronous OpenSerp API client
 """
 
+import hashlib
+import json
 import time
-from typing import Optional, List, Dict, Any
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Tuple, Type, Union
 
+import msgpack
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
+from .bloom import BloomFilter
 from .cache import Cache, InMemoryCache
 from .rate_limiter import RateLimiter
 from .exceptions import (
@@ -17,8 +22,32 @@ from .exceptions import (
     OpenSerpTimeoutError,
     OpenSerpAPIError,
     OpenSerpValidationError,
+    OpenSerpRateLimitError,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
+_PATH_SEARCH = "/mega/search"
+_PATH_ENGINES = "/engines"
+_RETRY_STATUSES = (500, 502, 503, 504)
+_USER_AGENT = "openserp-wrapper/1.0"
+
+_ERR_EMPTY_TEXT = "Search text must be a non-empty string"
+_ERR_LIMIT = "Limit must be between 1 and 100"
+_ERR_OFFSET = "Offset must be non-negative"
+
+
+class _Retry(Retry):
+    """Retry policy that never sleeps through a 429
+
+    urllib3 retries any status in ``RETRY_AFTER_STATUS_CODES`` that carries a
+    Retry-After header, regardless of ``status_forcelist``. Dropping 429 from
+    that set lets the header reach the caller via OpenSerpRateLimitError.
+    """
+
+    RETRY_AFTER_STATUS_CODES = frozenset({413, 503})
+
 
 class OpenSerpClient:
     """Synchronous client for OpenSerp API
@@ -30,6 +59,18 @@ class OpenSerpClient:
         cache_ttl: Cache time-to-live in seconds (default: 3600)
         rate_limiter: Rate limiter instance (default: None)
         verify_ssl: Verify SSL certificates (default: True)
+        pool_connections: Number of connection pools to cache (default: 32)
+        pool_maxsize: Maximum connections kept alive per pool; also the httpx
+            connection and keep-alive limit (default: 64)
+        serializer: Cache payload format, 'msgpack' or 'json' (default: 'msgpack')
+        bloom_filter: Skip cache lookups for keys this client never stored.
+            Only worthwhile for remote caches such as Redis, and only when this
+            client is the sole writer (default: False)
+        bloom_capacity: Expected number of distinct cached queries (default: 10000)
+        transport: HTTP stack, 'requests' or 'httpx' for HTTP/2 multiplexing
+            (default: 'requests')
+        error_cache_ttl: Seconds to cache API error responses, 0 to disable
+            (default: 60)
     """
 
     def __init__(
@@ -40,31 +81,107 @@ class OpenSerpClient:
         cache_ttl: int = 3600,
         rate_limiter: Optional[RateLimiter] = None,
         verify_ssl: bool = True,
+        pool_connections: int = 32,
+        pool_maxsize: int = 64,
+        serializer: str = "msgpack",
+        bloom_filter: bool = False,
+        bloom_capacity: int = 10000,
+        transport: str = "requests",
+        error_cache_ttl: int = 60,
     ):
+        if serializer not in ("msgpack", "json"):
+            raise OpenSerpValidationError("Serializer must be 'msgpack' or 'json'")
+        if transport not in ("requests", "httpx"):
+            raise OpenSerpValidationError("Transport must be 'requests' or 'httpx'")
+
         self.base_url = base_url.rstrip("/")
+        self._search_url = self.base_url + _PATH_SEARCH
+        self._engines_url = self.base_url + _PATH_ENGINES
         self.timeout = timeout
         self.cache = cache or InMemoryCache()
         self.cache_ttl = cache_ttl
+        self.error_cache_ttl = error_cache_ttl
         self.rate_limiter = rate_limiter
         self.verify_ssl = verify_ssl
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.serializer = serializer
+        self._bloom = BloomFilter(bloom_capacity) if bloom_filter else None
+        self.transport = transport
         self.session = self._create_session()
+        self._httpx: Optional["httpx.Client"] = None
+        self._timeout_errors: Tuple[Type[BaseException], ...] = (
+            requests.exceptions.Timeout,
+        )
+        self._connection_errors: Tuple[Type[BaseException], ...] = (
+            requests.exceptions.ConnectionError,
+        )
+        self._request_errors: Tuple[Type[BaseException], ...] = (
+            requests.exceptions.RequestException,
+        )
+        if transport == "httpx":
+            import httpx
+
+            self._httpx = self._create_httpx_client()
+            self._timeout_errors += (httpx.TimeoutException,)
+            self._connection_errors += (httpx.TransportError,)
+            self._request_errors += (httpx.HTTPError,)
 
     def _create_session(self) -> requests.Session:
-        """Create requests session with retry strategy"""
+        """Create requests session with retry strategy and keep-alive pool"""
         session = requests.Session()
+        session.headers.update(
+            {
+                "Connection": "keep-alive",
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": _USER_AGENT,
+            }
+        )
 
-        retry_strategy = Retry(
+        retry_strategy = _Retry(
             total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=False,
+            max_retries=retry_strategy,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         return session
 
+    def _create_httpx_client(self) -> "httpx.Client":
+        """Create an HTTP/2 httpx client sized from ``pool_maxsize``
+
+        httpx only retries failed connection attempts, not error statuses, so
+        5xx responses are surfaced on the first occurrence.
+        """
+        import httpx
+
+        transport = httpx.HTTPTransport(
+            http2=True,
+            verify=self.verify_ssl,
+            retries=3,
+            limits=httpx.Limits(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.pool_maxsize,
+            ),
+        )
+        return httpx.Client(
+            timeout=self.timeout,
+            headers={"User-Agent": _USER_AGENT},
+            transport=transport,
+        )
+
     def search(
         self,
         text: str,
@@ -94,81 +211,153 @@ class OpenSerpClient:
         Raises:
             OpenSerpValidationError: If input validation fails
             OpenSerpConnectionError: If connection fails
+            OpenSerpRateLimitError: On HTTP 429, without retrying; a subclass
+                of OpenSerpConnectionError carrying ``retry_after``
             OpenSerpAPIError: If API returns an error
         """
 
         # Validate input
         if not text or not isinstance(text, str):
-            raise OpenSerpValidationError("Search text must be a non-empty string")
+            raise OpenSerpValidationError(_ERR_EMPTY_TEXT)
         if not 1 <= limit <= 100:
-            raise OpenSerpValidationError("Limit must be between 1 and 100")
+            raise OpenSerpValidationError(_ERR_LIMIT)
         if offset < 0:
-            raise OpenSerpValidationError("Offset must be non-negative")
+            raise OpenSerpValidationError(_ERR_OFFSET)
 
-        # Check rate limit
-        if self.rate_limiter:
-            self.rate_limiter.wait()
+        # Canonicalize engines once so ordering and duplicates share a cache entry
+        engines_canon = tuple(sorted(set(engines))) if engines else None
 
-        # Check cache
-        cache_key = self._generate_cache_key(text, engines, limit, offset)
-        cached_result = self.cache.get(cache_key)
-        if cached_result:
-            return cached_result
+        # Bind hot-path attributes to locals
+        cache = self.cache
+        bloom = self._bloom
+        session = self.session
+        httpx_client = self._httpx
+        timeout = self.timeout
+        verify = self.verify_ssl
+        ttl = self.cache_ttl
+        rl = self.rate_limiter
+
+        # Check rate limit
+        if rl:
+            rl.wait()
 
         # Build request
-        params = {
+        params: Dict[str, Any] = {
             "text": text,
             "limit": limit,
             "offset": offset,
             "sort": sort,
         }
+        if engines_canon or date_from or date_to or language:
+            self._augment_params(params, engines_canon, date_from, date_to, language)
 
-        if engines:
-            params["engines"] = ",".join(engines)
-        if date_from and date_to:
-            params["date"] = f"{date_from}..{date_to}"
-        elif date_from:
-            params["date_from"] = date_from
-        elif date_to:
-            params["date_to"] = date_to
-        if language:
-            params["lang"] = language
+        # Check cache
+        cache_key = self._generate_cache_key(params)
+        if bloom is None or cache_key in bloom:
+            cached_blob = cache.get(cache_key)
+            if cached_blob is not None:
+                cached_result = self._deserialize(cached_blob)
+                if isinstance(cached_result, dict) and cached_result.get("__error__"):
+                    raise OpenSerpAPIError(
+                        f"API error: {cached_result['text']}",
+                        status_code=cached_result["status"],
+                    )
+                return cached_result
 
         try:
-            response = self.session.get(
-                urljoin(self.base_url, "/mega/search"),
-                params=params,
-                timeout=self.timeout,
-                verify=self.verify_ssl,
-            )
+            if httpx_client is not None:
+                response = httpx_client.get(self._search_url, params=params)
+            else:
+                response = session.get(
+                    self._search_url,
+                    params=params,
+                    timeout=timeout,
+                    verify=verify,
+                )
 
             # Handle HTTP errors
             if response.status_code == 429:
-                raise OpenSerpConnectionError(
-                    "Rate limited by OpenSerp server", "RATE_LIMIT"
+                raise OpenSerpRateLimitError(
+                    "Rate limited by OpenSerp server",
+                    retry_after=self._parse_retry_after(response),
+                    code="RATE_LIMIT",
                 )
             elif response.status_code >= 400:
+                error_text = self._response_text(response)[:512]
+                if self.error_cache_ttl > 0:
+                    error = {
+                        "__error__": True,
+                        "status": response.status_code,
+                        "text": error_text,
+                    }
+                    cache.set(
+                        cache_key, self._serialize(error), ttl=self.error_cache_ttl
+                    )
+                    if bloom is not None:
+                        bloom.add(cache_key)
                 raise OpenSerpAPIError(
-                    f"API error: {response.text}",
+                    f"API error: {error_text}",
                     status_code=response.status_code,
                 )
 
-            result = response.json()
+            try:
+                result = orjson.loads(response.content)
+            except orjson.JSONDecodeError as e:
+                raise OpenSerpAPIError(
+                    "Invalid JSON in search response",
+                    status_code=response.status_code,
+                ) from e
 
             # Cache result
-            self.cache.set(cache_key, result, ttl=self.cache_ttl)
+            cache.set(cache_key, self._serialize(result), ttl=ttl)
+            if bloom is not None:
+                bloom.add(cache_key)
 
             return result
 
-        except requests.exceptions.Timeout as e:
-            raise OpenSerpTimeoutError(f"Request timeout after {self.timeout}s") from e
-        except requests.exceptions.ConnectionError as e:
+        except self._timeout_errors as e:
+            raise OpenSerpTimeoutError(f"Request timeout after {timeout}s") from e
+        except self._connection_errors as e:
             raise OpenSerpConnectionError(
                 f"Failed to connect to {self.base_url}"
             ) from e
-        except requests.exceptions.RequestException as e:
+        except self._request_errors as e:
             raise OpenSerpConnectionError(f"Request error: {str(e)}") from e
 
+    def search_many(
+        self,
+        queries: List[Dict[str, Any]],
+        max_workers: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Run several searches concurrently over the shared session
+
+        Threads are used rather than processes because the work is I/O-bound;
+        the worker count is capped at ``pool_maxsize`` so that threads do not
+        queue up waiting for a pooled connection. Each worker decodes its own
+        response as soon as it arrives; orjson holds the GIL while parsing, so
+        deferring decoding to the calling thread would only serialize it
+        behind the slowest request.
+
+        Args:
+            queries: List of keyword-argument dicts, one per ``search()`` call
+            max_workers: Maximum number of concurrent requests (default: 10)
+
+        Returns:
+            List of search results in the same order as ``queries``
+
+        Raises:
+            The first exception raised by any ``search()`` call, in order
+        """
+        if not queries:
+            return []
+        if max_workers < 1:
+            raise OpenSerpValidationError("max_workers must be at least 1")
+
+        max_workers = min(max_workers, self.pool_maxsize, len(queries))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.search, **query) for query in queries]
+            return [future.result() for future in futures]
+
     def search_engines(self) -> List[str]:
         """Get list of available search engines
 
@@ -176,23 +365,43 @@ class OpenSerpClient:
             List of available engine names
         """
         try:
-            response = self.session.get(
-                urljoin(self.base_url, "/engines"),
-                timeout=self.timeout,
-                verify=self.verify_ssl,
-            )
+            if self._httpx is not None:
+                response = self._httpx.get(self._engines_url)
+            else:
+                response = self.session.get(
+                    self._engines_url,
+                    timeout=self.timeout,
+                    verify=self.verify_ssl,
+                )
             response.raise_for_status()
-            return response.json().get("engines", [])
         except Exception as e:
             raise OpenSerpConnectionError(f"Failed to fetch engines: {str(e)}") from e
 
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise OpenSerpAPIError(
+                "Invalid JSON in engines response",
+                status_code=response.status_code,
+            ) from e
+        if not isinstance(data, dict):
+            raise OpenSerpAPIError(
+                "Unexpected engines response format",
+                status_code=response.status_code,
+            )
+        return data.get("engines", [])
+
     def clear_cache(self) -> None:
         """Clear all cached results"""
         self.cache.clear()
+        if self._bloom is not None:
+            self._bloom.clear()
 
     def close(self) -> None:
         """Close the HTTP session"""
         self.session.close()
+        if self._httpx is not None:
+            self._httpx.close()
 
     def __enter__(self):
         """Context manager entry"""
@@ -202,13 +411,69 @@ class OpenSerpClient:
         """Context manager exit"""
         self.close()
 
+    def _serialize(self, result: Dict[str, Any]) -> bytes:
+        """Encode a search result for storage in the cache"""
+        if self.serializer == "json":
+            return json.dumps(result).encode()
+        return msgpack.packb(result, use_bin_type=True)
+
+    def _deserialize(self, blob: bytes) -> Dict[str, Any]:
+        """Decode a cached search result"""
+        if self.serializer == "json":
+            return json.loads(blob)
+        return msgpack.unpackb(blob, raw=False)
+
     @staticmethod
-    def _generate_cache_key(
-        text: str,
-        engines: Optional[List[str]] = None,
-        limit: int = 10,
-        offset: int = 0,
-    ) -> str:
-        """Generate cache key from search parameters"""
-        engine_str = ",".join(sorted(engines)) if engines else "all"
-        return f"search:{text}:{engine_str}:{limit}:{offset}"
+    def _augment_params(
+        params: Dict[str, Any],
+        engines: Optional[Tuple[str, ...]],
+        date_from: Optional[str],
+        date_to: Optional[str],
+        language: Optional[str],
+    ) -> None:
+        """Add optional filters to search request params in place"""
+        if engines:
+            params["engines"] = ",".join(engines)
+        if date_from and date_to:
+            params["date"] = f"{date_from}..{date_to}"
+        elif date_from:
+            params["date_from"] = date_from
+        elif date_to:
+            params["date_to"] = date_to
+        if language:
+            params["lang"] = language
+
+    @staticmethod
+    def _response_text(response: Union[requests.Response, "httpx.Response"]) -> str:
+        """Decode a response body without falling back to charset detection"""
+        content = response.content
+        try:
+            return content.decode(response.encoding or "utf-8", "replace")
+        except LookupError:
+            # Unknown charset in Content-Type
+            return content.decode("utf-8", "replace")
+
+    @staticmethod
+    def _parse_retry_after(
+        response: Union[requests.Response, "httpx.Response"]
+    ) -> Optional[int]:
+        """Return the Retry-After header in seconds, if given as an integer"""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0, int(value))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _generate_cache_key(params: Dict[str, Any]) -> str:
+        """Generate a fixed-size cache key from the request params
+
+        Every parameter sent to the server is part of the key, so requests that
+        differ only by filters (language, dates, sort) never share an entry.
+        ``engines`` must already be canonicalized before it is joined.
+        """
+        payload = repr(sorted(params.items())).encode()
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        return f"s:{digest}"
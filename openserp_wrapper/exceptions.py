@@ -2,15 +2,29 @@
 Custom exceptions for OpenSerp wrapper
 """
 
+from typing import Optional
+
 
 class OpenSerpException(Exception):
     """Base exception class for all OpenSerp wrapper errors"""
 
-    def __init__(self, message: str, code: str = None):
+    __slots__ = ("message", "code")
+
+    def __init__(self, message: str, code: Optional[str] = None):
         self.message = message
         self.code = code
         super().__init__(self.message)
 
+    def __reduce__(self):
+        # Slot attributes are not part of __dict__, so pickle them explicitly
+        # alongside it (BaseException still keeps __notes__ etc. there)
+        state = dict(self.__dict__)
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return type(self), self.args, state
+
     def __str__(self):
         if self.code:
             return f"[{self.code}] {self.message}"
@@ -20,19 +34,26 @@ class OpenSerpException(Exception):
 class OpenSerpConnectionError(OpenSerpException):
     """Raised when connection to OpenSerp server fails"""
 
-    pass
+    __slots__ = ()
 
 
 class OpenSerpTimeoutError(OpenSerpException):
     """Raised when OpenSerp server request times out"""
 
-    pass
+    __slots__ = ()
 
 
 class OpenSerpAPIError(OpenSerpException):
     """Raised when OpenSerp API returns an error"""
 
-    def __init__(self, message: str, status_code: int = None, code: str = None):
+    __slots__ = ("status_code",)
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        code: Optional[str] = None,
+    ):
         super().__init__(message, code)
         self.status_code = status_code
 
@@ -40,18 +61,25 @@ class OpenSerpAPIError(OpenSerpException):
 class OpenSerpValidationError(OpenSerpException):
     """Raised when input validation fails"""
 
-    pass
+    __slots__ = ()
 
 
-class OpenSerpRateLimitError(OpenSerpException):
+class OpenSerpRateLimitError(OpenSerpConnectionError):
     """Raised when rate limit is exceeded"""
 
-    def __init__(self, message: str, retry_after: int = None):
-        super().__init__(message)
+    __slots__ = ("retry_after",)
+
+    def __init__(
+        self,
+        message: str,
+        retry_after: Optional[int] = None,
+        code: Optional[str] = None,
+    ):
+        super().__init__(message, code)
         self.retry_after = retry_after
 
 
 class OpenSerpCacheError(OpenSerpException):
     """Raised when cache operations fail"""
 
-    pass
+    __slots__ = ()
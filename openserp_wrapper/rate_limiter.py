@@ -0,0 +1,41 @@
+"""
+Client-side request throttling
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class RateLimiter:
+    """Sliding-window rate limiter shared across threads
+
+    Args:
+        max_requests: Requests allowed per window (default: 60)
+        window_seconds: Window length in seconds (default: 60)
+    """
+
+    def __init__(self, max_requests: int = 60, window_seconds: float = 60):
+        if max_requests < 1:
+            raise ValueError("max_requests must be at least 1")
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._timestamps: deque = deque()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until a request may be sent, then record it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                cutoff = now - self.window_seconds
+                while self._timestamps and self._timestamps[0] <= cutoff:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.max_requests:
+                    self._timestamps.append(now)
+                    return
+                delay = self._timestamps[0] - cutoff
+            time.sleep(delay)
@@ -0,0 +1,44 @@
+import pytest
+import responses
+
+from openserp_wrapper.client import OpenSerpClient
+
+BASE_URL = "http://openserp.test"
+SEARCH_URL = f"{BASE_URL}/mega/search"
+ENGINES_URL = f"{BASE_URL}/engines"
+
+
+class DictCache:
+    """Minimal cache backend recording every stored value"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    def clear(self):
+        self.store.clear()
+        self.ttls.clear()
+
+
+@pytest.fixture
+def cache():
+    return DictCache()
+
+
+@pytest.fixture
+def client(cache):
+    with OpenSerpClient(base_url=BASE_URL, cache=cache) as c:
+        yield c
+
+
+@pytest.fixture
+def mocked():
+    with responses.RequestsMock() as rsps:
+        yield rsps
@@ -0,0 +1,37 @@
+import pytest
+
+from openserp_wrapper.bloom import BloomFilter
+
+
+def test_added_keys_are_always_present():
+    bloom = BloomFilter(capacity=1000)
+    keys = [f"s:{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+
+
+def test_false_positive_rate_stays_near_target():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"s:{i}")
+
+    probes = 20000
+    false_positives = sum(f"miss:{i}" in bloom for i in range(probes))
+
+    assert false_positives / probes < 0.02
+
+
+def test_clear_removes_all_keys():
+    bloom = BloomFilter(capacity=100)
+    bloom.add("s:a")
+    bloom.clear()
+
+    assert "s:a" not in bloom
+
+
+@pytest.mark.parametrize("capacity, error_rate", [(0, 0.01), (10, 0), (10, 1)])
+def test_rejects_invalid_parameters(capacity, error_rate):
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=capacity, error_rate=error_rate)
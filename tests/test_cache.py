@@ -0,0 +1,39 @@
+import time
+
+from openserp_wrapper.cache import InMemoryCache
+
+
+def test_in_memory_cache_round_trip():
+    cache = InMemoryCache()
+    cache.set("k", b"v", ttl=60)
+
+    assert cache.get("k") == b"v"
+    assert cache.get("missing") is None
+
+
+def test_in_memory_cache_expires_entries(monkeypatch):
+    cache = InMemoryCache()
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache.set("k", b"v", ttl=10)
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+
+    assert cache.get("k") is None
+
+
+def test_in_memory_cache_evicts_oldest_entry():
+    cache = InMemoryCache(max_size=2)
+    for key in ("a", "b", "c"):
+        cache.set(key, key)
+
+    assert cache.get("a") is None
+    assert cache.get("c") == "c"
+
+
+def test_in_memory_cache_clear():
+    cache = InMemoryCache()
+    cache.set("k", b"v")
+    cache.clear()
+
+    assert cache.get("k") is None
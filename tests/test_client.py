@@ -0,0 +1,223 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from responses import matchers
+
+from openserp_wrapper.client import OpenSerpClient
+from openserp_wrapper.exceptions import (
+    OpenSerpAPIError,
+    OpenSerpConnectionError,
+    OpenSerpRateLimitError,
+    OpenSerpTimeoutError,
+    OpenSerpValidationError,
+)
+
+from .conftest import BASE_URL, ENGINES_URL, SEARCH_URL
+
+
+def test_search_engines_returns_engine_list(client, mocked):
+    mocked.get(ENGINES_URL, json={"engines": ["bing", "google"]})
+
+    assert client.search_engines() == ["bing", "google"]
+
+
+def test_search_engines_rejects_non_object_payload(client, mocked):
+    mocked.get(ENGINES_URL, json=["bing", "google"])
+
+    with pytest.raises(OpenSerpAPIError):
+        client.search_engines()
+
+
+def test_bloom_filter_is_opt_in(client):
+    assert client._bloom is None
+
+
+def test_rate_limit_surfaces_retry_after_without_retrying(client, mocked):
+    mocked.get(SEARCH_URL, status=429, headers={"Retry-After": "7"})
+
+    with pytest.raises(OpenSerpConnectionError) as excinfo:
+        client.search("golang")
+
+    assert isinstance(excinfo.value, OpenSerpRateLimitError)
+    assert excinfo.value.retry_after == 7
+    assert str(excinfo.value).startswith("[RATE_LIMIT]")
+    assert len(mocked.calls) == 1
+
+
+def test_retry_policy_leaves_429_to_caller(client):
+    retry = client.session.get_adapter(SEARCH_URL).max_retries
+
+    assert not retry.is_retry("GET", 429, has_retry_after=True)
+    assert retry.is_retry("GET", 503, has_retry_after=True)
+
+
+def test_api_error_is_served_from_negative_cache(client, mocked):
+    mocked.get(SEARCH_URL, status=404, body="x" * 1000)
+
+    with pytest.raises(OpenSerpAPIError) as fresh:
+        client.search("golang")
+    with pytest.raises(OpenSerpAPIError) as cached:
+        client.search("golang")
+
+    assert len(mocked.calls) == 1
+    assert cached.value.status_code == fresh.value.status_code == 404
+    assert str(cached.value) == str(fresh.value)
+
+
+def test_error_cache_can_be_disabled(cache, mocked):
+    mocked.get(SEARCH_URL, status=404, body="not found")
+
+    with OpenSerpClient(base_url=BASE_URL, cache=cache, error_cache_ttl=0) as c:
+        for _ in range(2):
+            with pytest.raises(OpenSerpAPIError):
+                c.search("golang")
+
+    assert len(mocked.calls) == 2
+    assert cache.store == {}
+
+
+def test_api_error_with_unknown_charset_is_decoded(client, mocked):
+    mocked.get(
+        SEARCH_URL,
+        status=400,
+        body=b"bad query",
+        content_type="text/plain; charset=bogus",
+    )
+
+    with pytest.raises(OpenSerpAPIError) as excinfo:
+        client.search("golang")
+
+    assert excinfo.value.status_code == 400
+    assert "bad query" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("serializer", ["msgpack", "json"])
+def test_cached_result_round_trips_through_serializer(cache, mocked, serializer):
+    payload = {"query": "golang", "results": [{"title": "Go", "rank": 1}]}
+    mocked.get(SEARCH_URL, json=payload)
+
+    with OpenSerpClient(base_url=BASE_URL, cache=cache, serializer=serializer) as c:
+        assert c.search("golang") == payload
+        assert c.search("golang") == payload
+
+    assert len(mocked.calls) == 1
+    assert all(isinstance(blob, bytes) for blob in cache.store.values())
+
+
+def test_rejects_unknown_serializer():
+    with pytest.raises(OpenSerpValidationError):
+        OpenSerpClient(serializer="pickle")
+
+
+def test_search_many_preserves_query_order(client, mocked):
+    for text in ("alpha", "beta", "gamma"):
+        mocked.get(
+            SEARCH_URL,
+            json={"query": text},
+            match=[matchers.query_param_matcher({"text": text}, strict_match=False)],
+        )
+
+    results = client.search_many(
+        [{"text": "alpha"}, {"text": "beta"}, {"text": "gamma"}], max_workers=3
+    )
+
+    assert [r["query"] for r in results] == ["alpha", "beta", "gamma"]
+
+
+def test_search_many_reraises_first_failure(client, mocked):
+    mocked.get(SEARCH_URL, json={"query": "ok"})
+
+    with pytest.raises(OpenSerpValidationError) as excinfo:
+        client.search_many([{"text": "ok"}, {"text": ""}, {"text": "ok", "limit": 0}])
+
+    assert "non-empty" in str(excinfo.value)
+
+
+def test_search_many_caps_workers_at_pool_maxsize(cache, monkeypatch):
+    seen = {}
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def __init__(self, max_workers):
+            seen["max_workers"] = max_workers
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr("openserp_wrapper.client.ThreadPoolExecutor", RecordingExecutor)
+
+    with OpenSerpClient(base_url=BASE_URL, cache=cache, pool_maxsize=2) as c:
+        monkeypatch.setattr(c, "search", lambda **query: query)
+        results = c.search_many([{"text": str(i)} for i in range(5)], max_workers=8)
+
+    assert seen["max_workers"] == 2
+    assert results == [{"text": str(i)} for i in range(5)]
+
+
+def test_engine_order_and_duplicates_share_cache_entry(client, cache, mocked):
+    mocked.get(SEARCH_URL, json={"query": "golang"})
+
+    client.search("golang", engines=["google", "bing"])
+    client.search("golang", engines=["bing", "google", "bing"])
+
+    assert len(mocked.calls) == 1
+    assert len(cache.store) == 1
+    assert "engines=bing%2Cgoogle" in mocked.calls[0].request.url
+
+
+def _httpx_client(cache, handler):
+    client = OpenSerpClient(base_url=BASE_URL, cache=cache, transport="httpx")
+    client._httpx.close()
+    client._httpx = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_httpx_transport_returns_results(cache):
+    def handler(request):
+        assert request.url.params["text"] == "golang"
+        return httpx.Response(200, json={"query": "golang"})
+
+    with _httpx_client(cache, handler) as c:
+        assert c.search("golang") == {"query": "golang"}
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (httpx.ReadTimeout, OpenSerpTimeoutError),
+        (httpx.ConnectError, OpenSerpConnectionError),
+    ],
+)
+def test_httpx_transport_maps_errors(cache, error, expected):
+    def handler(request):
+        raise error("boom", request=request)
+
+    with _httpx_client(cache, handler) as c:
+        with pytest.raises(expected):
+            c.search("golang")
+
+
+def test_error_for_one_language_does_not_poison_another(client, mocked):
+    mocked.get(
+        SEARCH_URL,
+        status=400,
+        body="bad lang",
+        match=[matchers.query_param_matcher({"lang": "ZZ"}, strict_match=False)],
+    )
+    mocked.get(
+        SEARCH_URL,
+        json={"query": "x"},
+        match=[matchers.query_param_matcher({"lang": "EN"}, strict_match=False)],
+    )
+
+    with pytest.raises(OpenSerpAPIError):
+        client.search("x", language="ZZ")
+
+    assert client.search("x", language="EN") == {"query": "x"}
+    assert len(mocked.calls) == 2
+
+
+def test_cached_non_object_result_is_returned(client, mocked):
+    mocked.get(SEARCH_URL, json=[{"title": "Go"}])
+
+    assert client.search("golang") == [{"title": "Go"}]
+    assert client.search("golang") == [{"title": "Go"}]
+    assert len(mocked.calls) == 1
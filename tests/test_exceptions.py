@@ -0,0 +1,37 @@
+import pickle
+
+from openserp_wrapper.exceptions import (
+    OpenSerpAPIError,
+    OpenSerpConnectionError,
+    OpenSerpRateLimitError,
+)
+
+
+def test_pickle_preserves_slot_attributes():
+    error = pickle.loads(
+        pickle.dumps(OpenSerpAPIError("boom", status_code=502, code="UPSTREAM"))
+    )
+
+    assert error.status_code == 502
+    assert str(error) == "[UPSTREAM] boom"
+
+
+def test_pickle_preserves_rate_limit_details():
+    error = pickle.loads(
+        pickle.dumps(OpenSerpRateLimitError("slow", retry_after=5, code="RATE_LIMIT"))
+    )
+
+    assert isinstance(error, OpenSerpConnectionError)
+    assert error.retry_after == 5
+    assert error.code == "RATE_LIMIT"
+
+
+def test_pickle_preserves_notes_and_extra_attributes():
+    error = OpenSerpConnectionError("down")
+    error.add_note("ctx")
+    error.query = "golang"
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert restored.__notes__ == ["ctx"]
+    assert restored.query == "golang"
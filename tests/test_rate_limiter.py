@@ -0,0 +1,39 @@
+import time
+
+import pytest
+
+from openserp_wrapper.rate_limiter import RateLimiter
+
+
+def test_allows_requests_within_window(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    limiter = RateLimiter(max_requests=3, window_seconds=60)
+
+    for _ in range(3):
+        limiter.wait()
+
+    assert sleeps == []
+
+
+def test_blocks_once_window_is_full(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+
+    def fake_sleep(delay):
+        clock[0] += delay
+
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+    limiter = RateLimiter(max_requests=2, window_seconds=10)
+
+    limiter.wait()
+    limiter.wait()
+    limiter.wait()
+
+    assert clock[0] == pytest.approx(110.0)
+
+
+@pytest.mark.parametrize("max_requests, window", [(0, 1), (1, 0)])
+def test_rejects_invalid_parameters(max_requests, window):
+    with pytest.raises(ValueError):
+        RateLimiter(max_requests=max_requests, window_seconds=window)